@@ -16,6 +16,7 @@ This is repeated until the user enters an empty message.
 """
 
 # ruff: noqa: T201
+import socket
 import sys
 
 import sliplib
@@ -28,6 +29,9 @@ def main() -> None:
     port = sys.argv[1]
     print(f"Connecting to server on port {port}")
     sock = sliplib.SlipSocket.create_connection(("localhost", int(port)))
+    # The echo exchange is strictly request/reply with tiny messages,
+    # so disable Nagle's algorithm to avoid delayed sends.
+    sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
     print(f"Connected to {sock.getpeername()}")
 
     while True:
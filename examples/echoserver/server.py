@@ -50,6 +50,9 @@ class SlipHandler(SlipRequestHandler):
             request.__class__ = _ChattySocket
         else:
             request = _ChattySocket(request)
+        # The echo exchange is strictly request/reply with tiny messages,
+        # so disable Nagle's algorithm to avoid delayed sends.
+        request.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
         print(f"Incoming connection from {request.getpeername()}")
         super().__init__(request, *args)
 
@@ -59,7 +62,7 @@ class SlipHandler(SlipRequestHandler):
             message = self.request.recv_msg()
             print("Decoded data:", message)
             if message:
-                self.request.send_msg(bytes(reversed(message)))
+                self.request.send_msg(message[::-1])
             else:
                 print("Closing down")
                 break
@@ -60,7 +60,7 @@ Exceptions
 .. autoexception:: ProtocolError
 """
 
-from sliplib.slip import END, ESC, ESC_END, ESC_ESC, Driver, ProtocolError, decode, encode, is_valid
+from sliplib.slip import END, ESC, ESC_END, ESC_ESC, Driver, ProtocolError, decode, encode, encode_many, is_valid
 from sliplib.slipserver import SlipRequestHandler, SlipServer
 from sliplib.slipsocket import SlipSocket
 from sliplib.slipstream import SlipStream
@@ -68,6 +68,7 @@ from sliplib.slipwrapper import SlipWrapper
 
 __all__ = [
     "encode",
+    "encode_many",
     "decode",
     "is_valid",
     "Driver",
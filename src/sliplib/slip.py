@@ -25,6 +25,7 @@ Functions
 The following are lower-level functions, that should normally not be used directly.
 
 .. autofunction:: encode
+.. autofunction:: encode_many
 .. autofunction:: decode
 .. autofunction:: is_valid
 
@@ -45,12 +46,27 @@ from __future__ import annotations
 
 import re
 from queue import Empty, Queue
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
 
 END = b"\xc0"  #: The SLIP `END` byte.
 ESC = b"\xdb"  #: The SLIP `ESC` byte.
 ESC_END = b"\xdc"  #: When preceded by an `ESC` byte, this represents an escaped `END` byte.
 ESC_ESC = b"\xdd"  #: When preceded by an `ESC` byte, this represents an escaped `ESC` byte.
 
+# The escape sequences, precomputed once instead of on every encode() or decode() call.
+_ESCAPED_END = ESC + ESC_END
+_ESCAPED_ESC = ESC + ESC_ESC
+
+# Precompiled pattern that matches an ESC byte that is not followed by an ESC_END or ESC_ESC byte.
+_INVALID_ESCAPE_SEQUENCE_RE = re.compile(ESC + b"[^" + ESC_END + ESC_ESC + b"]")
+
+# Precomputed single-byte objects, to avoid a bytes construction
+# for every byte when data is received byte for byte.
+_SINGLE_BYTES = tuple(bytes((i,)) for i in range(256))
+
 
 class ProtocolError(ValueError):
     """Exception to indicate that a SLIP protocol error has occurred.
@@ -76,7 +92,28 @@ def encode(msg: bytes) -> bytes:
         The SLIP-encoded message
     """
     msg = bytes(msg)
-    return END + msg.replace(ESC, ESC + ESC_ESC).replace(END, ESC + ESC_END) + END
+    if ESC not in msg and END not in msg:
+        # Without ESC or END bytes there is nothing to escape.
+        return END + msg + END
+    return END + msg.replace(ESC, _ESCAPED_ESC).replace(END, _ESCAPED_END) + END
+
+
+def encode_many(messages: Iterable[bytes]) -> bytes:
+    """Encodes a sequence of messages into a single byte sequence of SLIP-encoded packets.
+
+    Encoding the messages in one call avoids the intermediate concatenations
+    that occur when the packets from individual :func:`encode` calls
+    are combined one by one.
+
+    Args:
+        messages: The messages that must be encoded.
+
+    Returns:
+        The concatenated SLIP-encoded messages.
+
+    .. versionadded:: 0.7
+    """
+    return b"".join(encode(message) for message in messages)
 
 
 def decode(packet: bytes) -> bytes:
@@ -94,9 +131,13 @@ def decode(packet: bytes) -> bytes:
     Raises:
         ProtocolError: if the packet contains an invalid byte sequence.
     """
-    if not is_valid(packet):
+    msg = packet.strip(END)
+    if not _is_valid_stripped(msg):
         raise ProtocolError(packet)
-    return packet.strip(END).replace(ESC + ESC_END, END).replace(ESC + ESC_ESC, ESC)
+    if ESC not in msg:
+        # Without ESC bytes there is nothing to unescape.
+        return msg
+    return msg.replace(_ESCAPED_END, END).replace(_ESCAPED_ESC, ESC)
 
 
 def is_valid(packet: bytes) -> bool:
@@ -113,8 +154,12 @@ def is_valid(packet: bytes) -> bool:
     Returns:
         :const:`True` if the packet is valid, :const:`False` otherwise
     """
-    packet = packet.strip(END)
-    return not (END in packet or packet.endswith(ESC) or re.search(ESC + b"[^" + ESC_END + ESC_ESC + b"]", packet))
+    return _is_valid_stripped(packet.strip(END))
+
+
+def _is_valid_stripped(packet: bytes) -> bool:
+    """Helper function that validates a packet from which the leading and trailing END bytes are already stripped."""
+    return not (END in packet or packet.endswith(ESC) or _INVALID_ESCAPE_SEQUENCE_RE.search(packet))
 
 
 class Driver:
@@ -126,7 +171,7 @@ class Driver:
 
     def __init__(self) -> None:
         self._finished = False
-        self._recv_buffer = b""
+        self._recv_buffer = bytearray()
         self._packets: Queue[bytes] = Queue()
 
     def send(self, message: bytes) -> bytes:
@@ -170,7 +215,10 @@ class Driver:
         # it is received as an integer, not as a bytes object.
         # It must first be converted into a bytes object.
         if isinstance(data, int):
-            data = bytes((data,))
+            if not 0 <= data < 256:
+                error_msg = f"received data byte {data} is not in range(0, 256)"
+                raise ValueError(error_msg)
+            data = _SINGLE_BYTES[data]
 
         # Empty data indicates that the data reception is complete.
         # To force a buffer flush, an END byte is added, so that the
@@ -179,27 +227,27 @@ class Driver:
             self._finished = True
             data = END
 
-        self._recv_buffer += data
-
-        # The following situations can occur:
-        #
-        #  1) _recv_buffer is empty or contains only END bytes --> no packets available
-        #  2) _recv_buffer contains non-END bytes --> one or more (partial) packets are available
-        #
-        # Strip leading END bytes from _recv_buffer to avoid handling empty packets.
-        self._recv_buffer = self._recv_buffer.lstrip(END)
-
-        # The _recv_buffer is now split on sequences of one or more END bytes.
-        # The trailing element from the split operation is a possibly incomplete
-        # packet; this element is therefore used as the new _recv_buffer.
-        # If _recv_buffer contains one or more trailing END bytes,
-        # (meaning that there are no incomplete packets), then the last element,
-        # and therefore the new _recv_buffer, is an empty bytes object.
-        *new_packets, self._recv_buffer = re.split(END + b"+", self._recv_buffer)
-
-        # Add the packets to the buffer
-        for packet in new_packets:
-            self._packets.put(packet)
+        buffer = self._recv_buffer
+        # The buffered partial packet cannot contain an END byte
+        # (it would have been extracted by a previous call),
+        # so the scan for END bytes can skip the buffered bytes.
+        scan = len(buffer)
+        buffer += data
+
+        # Scan the buffer for END bytes. Each END byte that is preceded
+        # by one or more packet bytes marks the end of a complete packet.
+        # An END byte that immediately follows another END byte delimits
+        # an empty packet; these are skipped.
+        start = 0
+        while (end := buffer.find(END, scan)) >= 0:
+            if end > start:
+                self._packets.put(bytes(buffer[start:end]))
+            start = scan = end + 1
+
+        # What remains after the final END byte is a possibly empty,
+        # incomplete packet.
+        if start:
+            del buffer[:start]
 
     def get(self, *, block: bool = True, timeout: float | None = None) -> bytes | None:
         """Get the next decoded message.
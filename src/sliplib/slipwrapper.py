@@ -16,6 +16,7 @@ SlipWrapper
 
    .. automethod:: recv_msg
    .. automethod:: send_msg
+   .. automethod:: send_msgs
    .. autoattribute:: driver
    .. autoattribute:: stream
 
@@ -32,7 +33,7 @@ import abc
 from typing import TYPE_CHECKING, Generic, TypeVar
 
 if TYPE_CHECKING:
-    from collections.abc import Iterator
+    from collections.abc import Iterable, Iterator
 
 from sliplib.slip import Driver
 
@@ -110,6 +111,22 @@ class SlipWrapper(abc.ABC, Generic[ByteStream]):
         packet = self.driver.send(message)
         self.send_bytes(packet)
 
+    def send_msgs(self, messages: Iterable[bytes]) -> None:
+        """Send multiple SLIP-encoded messages over the stream.
+
+        The messages are encoded into a single sequence of packets,
+        which is then sent in a single :meth:`send_bytes` call.
+        Compared to repeated :meth:`send_msg` calls this avoids
+        a write operation on the stream for each individual message.
+
+        Args:
+            messages (Iterable[bytes]): The messages to encode and send
+
+        .. versionadded:: 0.7
+        """
+        packet = b"".join(self.driver.send(message) for message in messages)
+        self.send_bytes(packet)
+
     def recv_msg(self) -> bytes:
         """Receive a single message from the stream.
 
@@ -11,7 +11,7 @@ from typing import Generator
 
 import pytest
 
-from sliplib import END, ESC, ESC_END, ESC_ESC, Driver, ProtocolError, decode, encode
+from sliplib import END, ESC, ESC_END, ESC_ESC, Driver, ProtocolError, decode, encode, encode_many, is_valid
 
 
 class TestEncoding:
@@ -57,6 +57,19 @@ class TestEncoding:
         assert encode(msg) == END + packet + END
 
 
+class TestBatchEncoding:
+    """Test batch encoding of multiple SLIP messages."""
+
+    def test_empty_message_list_encoding(self) -> None:
+        """An empty sequence of messages should result in an empty byte sequence."""
+        assert encode_many([]) == b""
+
+    def test_multiple_message_encoding(self) -> None:
+        """Encoding multiple messages must give the concatenation of the individual packets."""
+        msgs = [b"hallo", END + b"bye", b""]
+        assert encode_many(msgs) == b"".join(encode(msg) for msg in msgs)
+
+
 class TestDecoding:
     """Test decoding of SLIP packets."""
 
@@ -115,6 +128,34 @@ class TestDecoding:
         assert exc_info.value.args == (packet,)
 
 
+class TestValidation:
+    """Test validation of SLIP packets."""
+
+    @pytest.mark.parametrize(
+        "packet",
+        [
+            b"hallo",
+            END + b"hallo" + END,
+            END + END + ESC + ESC_END + END + END,
+        ],
+    )
+    def test_valid_packet(self, packet: bytes) -> None:
+        """A packet with only leading and/or trailing END bytes and valid escape sequences is valid."""
+        assert is_valid(packet)
+
+    @pytest.mark.parametrize(
+        "packet",
+        [
+            END + b"a" + END + b"z" + END,
+            END + b"hallo" + ESC + END,
+            END + ESC + b"x" + END,
+        ],
+    )
+    def test_invalid_packet(self, packet: bytes) -> None:
+        """A packet with an embedded END byte, a trailing ESC byte, or an invalid escape sequence is invalid."""
+        assert not is_valid(packet)
+
+
 class TestDriver:
     """Tests for the Driver class."""
 
@@ -167,6 +208,12 @@ class TestDriver:
         self.driver.receive(END)
         assert self.driver.get(timeout=0.5) == msg
 
+    @pytest.mark.parametrize("byte_", [-1, 256])
+    def test_receiving_out_of_range_integer_is_rejected(self, byte_: int) -> None:
+        """Test that receiving an integer outside range(0, 256) results in a ValueError."""
+        with pytest.raises(ValueError, match="range"):
+            self.driver.receive(byte_)
+
     def test_flush_buffers_with_empty_packet(self) -> None:
         """Test that receiving an empty byte string results in completion of the pending packet."""
         expected_msg_list = [b"hi", b"there"]
@@ -91,6 +91,14 @@ class TestSlipStreamBasics:
             mocker.call(END + msg_list[1] + END),
         ]
 
+    def test_slipstream_writing_multiple_messages(self, mocker: MockerFixture) -> None:
+        """Verify that sending multiple messages at once results in a single write call."""
+        msg_list = [b"hallo", b"bye"]
+        encoded_messages = END + msg_list[0] + END + END + msg_list[1] + END
+        self.stream_mock.write.side_effect = (len(encoded_messages),)
+        self.slipstream.send_msgs(msg_list)
+        assert self.stream_mock.write.mock_calls == [mocker.call(encoded_messages)]
+
     def test_slipstream_writing_single_bytes(self, mocker: MockerFixture) -> None:
         """Verify that sending messages work when the stream's write method does not handle all the bytes at once."""
         msg_list = [b"hallo", b"bye"]